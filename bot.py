@@ -1,9 +1,31 @@
 import os
-import re
 import asyncio
+import functools
 import logging
-from concurrent.futures import ThreadPoolExecutor
-
+import multiprocessing
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional, Sequence, Union
+
+from coincurve import PublicKey
+
+# coincurve._libsecp256k1 is coincurve's private cffi binding; it only stays
+# stable because requirements.txt pins coincurve to an exact version.
+from coincurve._libsecp256k1 import ffi, lib
+from coincurve.context import GLOBAL_CONTEXT
+from Crypto.Cipher import AES
+# _raw_keccak_lib and Crypto.Util._raw_api are private pycryptodome APIs; they
+# only stay stable because requirements.txt pins pycryptodome to an exact version.
+from Crypto.Hash.keccak import _raw_keccak_lib
+from Crypto.Util._raw_api import (
+    SmartPointer,
+    VoidPointer,
+    c_size_t,
+    c_ubyte,
+    create_string_buffer,
+    get_raw_buffer,
+)
 from dotenv import load_dotenv
 from eth_account import Account
 from telegram import Update
@@ -18,6 +40,9 @@ from telegram.ext import (
 # Load environment variables from a .env file (if present)
 load_dotenv()
 
+# eth_account hashes through eth_hash; pin it to pycryptodome's C Keccak backend.
+os.environ.setdefault("ETH_HASH_BACKEND", "pycryptodome")
+
 BOT_TOKEN = os.getenv("BOT_TOKEN")
 
 if not BOT_TOKEN:
@@ -29,10 +54,100 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# ThreadPoolExecutor for CPU-bound vanity generation tasks
-executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 4)
 
-HEX_PATTERN = re.compile(r"^[0-9a-fA-F]+$")
+def _init_worker(counter) -> None:
+    """Share the attempts counter with a search worker process."""
+    global attempts_counter
+    attempts_counter = counter
+
+
+# Candidates checked by all search workers since startup, added once per batch
+# (up to and including the match in a winning batch); the search rate is
+# logged from it every TELEMETRY_INTERVAL seconds.
+attempts_counter = multiprocessing.Value("Q", 0)
+TELEMETRY_INTERVAL = 5
+
+# Process pool for CPU-bound vanity generation tasks; one search runs on every worker.
+WORKERS = os.cpu_count() or 4
+
+
+def _new_search_executor() -> ProcessPoolExecutor:
+    """Create the search process pool, sharing attempts_counter with its workers."""
+    return ProcessPoolExecutor(
+        max_workers=WORKERS, initializer=_init_worker, initargs=(attempts_counter,)
+    )
+
+
+executor = _new_search_executor()
+
+# Points walked per batch from one random scalar (each gives CANDIDATES_PER_POINT
+# candidates); workers check the shared stop event between batches.
+BATCH_SIZE = 4096
+
+# Order of the secp256k1 group and its generator point G.
+CURVE_ORDER = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+GENERATOR = PublicKey.from_secret((1).to_bytes(32, "big"))
+
+# secp256k1 field prime and its efficient endomorphism: lambda * (x, y) equals
+# (beta * x, y), and -(x, y) equals (x, p - y). Every point on the walk thus
+# yields six candidates for the cost of one point addition.
+FIELD_PRIME = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEFFFFFC2F
+BETA = 0x7AE96A2B657C07106E64479EAC3434E99CF0497512F58995C1396C28719501EE
+LAMBDA = 0x5363AD4CC05C30E0A5261C028812645A122E22EA20816678DF02967C1B23BD72
+BETA_SQUARED = BETA * BETA % FIELD_PRIME
+LAMBDA_POWERS = (1, LAMBDA, LAMBDA * LAMBDA % CURVE_ORDER)
+CANDIDATES_PER_POINT = 6
+
+# Optional pool of pre-generated wallets, enabled by setting POOL_KEY. Private
+# keys are stored AES-GCM encrypted under POOL_KEY, which must be a random
+# 32-byte key written as 64 hex characters (not a passphrase).
+POOL_KEY = os.getenv("POOL_KEY")
+POOL_CIPHER_KEY: Optional[bytes] = None
+
+if POOL_KEY:
+    try:
+        POOL_CIPHER_KEY = bytes.fromhex(POOL_KEY)
+    except ValueError:
+        POOL_CIPHER_KEY = None
+    if POOL_CIPHER_KEY is None or len(POOL_CIPHER_KEY) != 32:
+        raise RuntimeError(
+            "POOL_KEY must be a random 32-byte key as 64 hex characters, "
+            'e.g. from: python -c "import secrets; print(secrets.token_hex(32))"'
+        )
+POOL_PATH = os.getenv("POOL_PATH", "pool.db")
+# Each row takes roughly 180 bytes on disk, so the default cap is about 18 MB.
+POOL_MAX_SIZE = int(os.getenv("POOL_MAX_SIZE", "100000"))
+
+
+def _new_pool_executor() -> ProcessPoolExecutor:
+    """Create the single low-priority worker that mines wallets into the pool."""
+    return ProcessPoolExecutor(max_workers=1, initializer=os.nice, initargs=(19,))
+
+
+pool_executor = _new_pool_executor()
+
+# Single thread owning the bot's pool connection, so claims never block the
+# event loop and are serialised against each other.
+pool_db_executor = ThreadPoolExecutor(max_workers=1)
+
+# _pool_db is only used on pool_db_executor's thread, _miner_db only in the
+# miner process. _pool_size tracks the row count without a COUNT(*) per batch.
+_pool_db: Optional[sqlite3.Connection] = None
+_miner_db: Optional[sqlite3.Connection] = None
+_pool_size = 0
+_pool_task: Optional[asyncio.Task] = None
+_telemetry_task: Optional[asyncio.Task] = None
+
+# Manager hosting the stop events shared between worker processes (started lazily).
+_manager = None
+
+# Requests waiting for a wallet, keyed by lowercase prefix. A single shared
+# search looks for all of them at once.
+pending: dict[str, list[asyncio.Future]] = {}
+_pending_changed = asyncio.Event()
+_search_task: Optional[asyncio.Task] = None
+
+HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
 
 
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -44,29 +159,477 @@ async def start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     )
 
 
-def generate_wallet(prefix: str) -> tuple[str, str]:
-    """Brute force search for an Ethereum address that starts with the given hex prefix.
+def _prefix_mask(prefix: str) -> tuple[int, int]:
+    """Return (target, mask) for matching ``prefix`` against the first 8 address bytes."""
+    if len(prefix) > 16:
+        raise ValueError("prefix longer than 16 hex characters")
+    mask = (0xFFFFFFFFFFFFFFFF << (64 - 4 * len(prefix))) & 0xFFFFFFFFFFFFFFFF
+    return int(prefix.ljust(16, "0"), 16), mask
 
-    Returns tuple (address, private_key_hex).
+
+def _iter_addresses(pubkeys: list[bytes]):
+    """Yield the 20-byte address of every 64-byte public key in ``pubkeys``.
+
+    Hashing goes through pycryptodome's raw Keccak functions on one reused
+    sponge state, skipping the per-hash object setup of ``keccak.new``.
     """
-    prefix = prefix.lower()
-    target = "0x" + prefix
-    attempts = 0
+    pointer = VoidPointer()
+    result = _raw_keccak_lib.keccak_init(pointer.address_of(), c_size_t(64), c_ubyte(24))
+    if result:
+        raise ValueError("Error %d while instantiating keccak" % result)
+    state = SmartPointer(pointer.get(), _raw_keccak_lib.keccak_destroy)
+    handle = state.get()
+    reset = _raw_keccak_lib.keccak_reset
+    absorb = _raw_keccak_lib.keccak_absorb
+    squeeze = _raw_keccak_lib.keccak_digest
+    digest = create_string_buffer(32)
+    pubkey_len = c_size_t(64)
+    digest_len = c_size_t(32)
+    padding = c_ubyte(0x01)
+    for pubkey in pubkeys:
+        reset(handle)
+        absorb(handle, pubkey, pubkey_len)
+        squeeze(handle, digest, digest_len, padding)
+        # The address is the last 20 bytes of the digest.
+        yield get_raw_buffer(digest)[12:]
+
+
+def _prefix_groups(prefixes: Sequence[str]) -> tuple[tuple[int, frozenset[int]], ...]:
+    """Group prefixes by length into (mask, targets) pairs for _make_matcher."""
+    groups: dict[int, set[int]] = {}
+    for prefix in prefixes:
+        target, mask = _prefix_mask(prefix)
+        groups.setdefault(mask, set()).add(target)
+    return tuple(sorted((mask, frozenset(targets)) for mask, targets in groups.items()))
+
+
+@functools.lru_cache(maxsize=64)
+def _make_matcher(groups: tuple[tuple[int, frozenset[int]], ...]):
+    """Compile ``find_match(pubkeys) -> int`` specialised for ``groups``.
+
+    The returned function yields the index of the first public key whose
+    address starts with any prefix, or -1. Masks and lone targets are folded
+    into the generated source as constants, so the hot loop reads the address
+    head as one 64-bit integer and runs a fixed chain of compares with no
+    loop over prefix lengths.
+    """
+    namespace = {"_iter_addresses": _iter_addresses, "from_bytes": int.from_bytes}
+    tests = []
+    for number, (mask, targets) in enumerate(groups):
+        if len(targets) == 1:
+            (target,) = targets
+            tests.append(f"head & {mask:#x} == {target:#x}")
+        else:
+            namespace[f"targets_{number}"] = targets
+            tests.append(f"head & {mask:#x} in targets_{number}")
+    code = f"""
+def find_match(pubkeys):
+    for index, addr in enumerate(_iter_addresses(pubkeys)):
+        head = from_bytes(addr[:8], "big")
+        if {" or ".join(tests) or "False"}:
+            return index
+    return -1
+"""
+    exec(code, namespace)
+    return namespace["find_match"]
+
+
+def _walk_pubkeys(start: PublicKey, count: int) -> list[bytes]:
+    """Return the 64-byte public keys of start, start + G, ... (``count`` points).
+
+    Calls libsecp256k1 through coincurve's cffi bindings directly so the walk
+    allocates no PublicKey object per step.
+    """
+    ctx = GLOBAL_CONTEXT.ctx
+    serialize = lib.secp256k1_ec_pubkey_serialize
+    combine = lib.secp256k1_ec_pubkey_combine
+    memmove = ffi.memmove
+    uncompressed = lib.SECP256K1_EC_UNCOMPRESSED
+    current = ffi.new("secp256k1_pubkey *")
+    following = ffi.new("secp256k1_pubkey *")
+    memmove(current, start.public_key, 64)
+    addends = ffi.new("secp256k1_pubkey *[2]", [current, GENERATOR.public_key])
+    out = ffi.new("unsigned char[65]")
+    out_len = ffi.new("size_t *")
+    buf = ffi.buffer(out)
+    pubkeys = []
+    for _ in range(count):
+        out_len[0] = 65
+        serialize(ctx, out, out_len, current, uncompressed)
+        pubkeys.append(buf[1:])
+        # combine clears its output before reading the inputs, so it cannot run in place.
+        combine(ctx, following, addends, 2)
+        memmove(current, following, 64)
+    return pubkeys
+
+
+def _expand_pubkeys(pubkeys: list[bytes]) -> list[bytes]:
+    """Return the six endomorphism and negation variants of every public key.
+
+    For a point k*G the variants are, in order, the keys of k, lambda*k,
+    lambda^2*k and the negations of those three; see _candidate_key.
+    """
+    from_bytes = int.from_bytes
+    candidates = []
+    extend = candidates.extend
+    for pubkey in pubkeys:
+        x_bytes = pubkey[:32]
+        y_bytes = pubkey[32:]
+        x = from_bytes(x_bytes, "big")
+        neg_y = (FIELD_PRIME - from_bytes(y_bytes, "big")).to_bytes(32, "big")
+        beta_x = (BETA * x % FIELD_PRIME).to_bytes(32, "big")
+        beta2_x = (BETA_SQUARED * x % FIELD_PRIME).to_bytes(32, "big")
+        extend(
+            (
+                pubkey,
+                beta_x + y_bytes,
+                beta2_x + y_bytes,
+                x_bytes + neg_y,
+                beta_x + neg_y,
+                beta2_x + neg_y,
+            )
+        )
+    return candidates
+
+
+def _candidate_key(base: int, index: int) -> int:
+    """Return the private key of candidate ``index`` from a walk starting at ``base``."""
+    step, variant = divmod(index, CANDIDATES_PER_POINT)
+    key = (base + step) * LAMBDA_POWERS[variant % 3] % CURVE_ORDER
+    return CURVE_ORDER - key if variant >= 3 else key
+
+
+def generate_wallet(
+    prefixes: Union[str, Sequence[str]], stop_event=None
+) -> Optional[tuple[str, str]]:
+    """Brute force search for an Ethereum address that starts with any of the given hex prefixes.
+
+    Each batch starts from a fresh random scalar k0 and walks k0, k0 + 1, ...
+    by adding G to the previous public key, which is far cheaper than a full
+    scalar multiplication per candidate, and tests the six endomorphism and
+    negation variants of every point. The ``Account`` object is only built
+    once a matching key has been found.
+
+    Returns tuple (address, private_key_hex), or None if ``stop_event`` was set
+    before a match was found.
+    """
+    if isinstance(prefixes, str):
+        prefixes = [prefixes]
+    prefixes = [prefix.lower() for prefix in prefixes]
+    find_match = _make_matcher(_prefix_groups(prefixes))
     while True:
-        acct = Account.create()
-        address = acct.address.lower()
-        attempts += 1
-        if address.startswith(target):
+        secret = os.urandom(32)
+        try:
+            point = PublicKey.from_secret(secret)
+        except ValueError:
+            # Secret is zero or not below the curve order; astronomically rare.
+            continue
+        pubkeys = _expand_pubkeys(_walk_pubkeys(point, BATCH_SIZE))
+        index = find_match(pubkeys)
+        # Count the candidates actually scanned, including the batch that matched.
+        with attempts_counter.get_lock():
+            attempts_counter.value += index + 1 if index >= 0 else len(pubkeys)
+        if index >= 0:
+            key = _candidate_key(int.from_bytes(secret, "big"), index)
+            # Re-derive the address from the scalar to double-check the walk.
+            acct = Account.from_key(key.to_bytes(32, "big"))
+            address = acct.address.lower()
+            if not any(address.startswith("0x" + prefix) for prefix in prefixes):
+                raise RuntimeError(f"Derived address {address} matches none of {prefixes}")
             return address, acct.key.hex()
-        # Optionally log progress every million attempts.
-        if attempts % 1_000_000 == 0:
-            logger.info("Tried %d keys for prefix %s", attempts, prefix)
+        if stop_event is not None and stop_event.is_set():
+            return None
+
+
+def _get_manager():
+    """Return the shared multiprocessing manager, starting it on first use."""
+    global _manager
+    if _manager is None:
+        _manager = multiprocessing.Manager()
+    return _manager
+
+
+async def _search_round(prefixes: list[str]) -> Optional[tuple[str, str]]:
+    """Run generate_wallet for ``prefixes`` on every pool worker.
+
+    Returns the first match, or None as soon as the set of pending prefixes
+    changes so the caller can restart with the new set.
+
+    Only one match per round is ever returned, and every later round walks
+    from fresh random scalars. Other candidates in the winning batch
+    (k0 + i and their lambda/negation variants) are derivable from the
+    returned key, so they must never be handed to another user.
+    """
+    loop = asyncio.get_running_loop()
+    stop_event = _get_manager().Event()
+    waiting = {
+        loop.run_in_executor(executor, generate_wallet, prefixes, stop_event)
+        for _ in range(WORKERS)
+    }
+    changed = loop.create_task(_pending_changed.wait())
+    waiting.add(changed)
+    try:
+        while True:
+            done, waiting = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                if future is not changed:
+                    result = future.result()
+                    if result is not None:
+                        return result
+            if changed in done:
+                return None
+    finally:
+        # Tell the remaining workers to give up and drop any that have not started.
+        stop_event.set()
+        for future in waiting:
+            future.cancel()
+
+
+def _resolve_pending(address: str, priv_key: str) -> None:
+    """Hand a found wallet to one request whose prefix it matches, longest prefix first.
+
+    Exactly one request receives each wallet; see _search_round for why other
+    matches from the same walk must not be shared out.
+    """
+    for prefix in sorted(pending, key=len, reverse=True):
+        if not address.startswith("0x" + prefix):
+            continue
+        waiters = pending[prefix]
+        for waiter in waiters:
+            if not waiter.done():
+                waiters.remove(waiter)
+                if not waiters:
+                    del pending[prefix]
+                waiter.set_result((address, priv_key))
+                return
+
+
+def _fail_pending(exc: BaseException) -> None:
+    """Fail every waiting request with ``exc`` and clear the queue."""
+    for waiters in pending.values():
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_exception(exc)
+    pending.clear()
+
+
+def _restart_executor() -> None:
+    """Replace a broken search pool, e.g. after a worker was killed."""
+    global executor
+    executor.shutdown(wait=False, cancel_futures=True)
+    executor = _new_search_executor()
+
+
+async def _run_searches() -> None:
+    """Search for every pending prefix in one shared pass until none are left."""
+    restarted = False
+    while pending:
+        _pending_changed.clear()
+        try:
+            result = await _search_round(list(pending))
+        except BrokenProcessPool as exc:
+            _restart_executor()
+            if restarted:
+                # The fresh pool broke as well; give up instead of looping.
+                _fail_pending(exc)
+                return
+            logger.warning("Search worker died; restarted the process pool")
+            restarted = True
+            continue
+        except Exception as exc:
+            _fail_pending(exc)
+            return
+        restarted = False
+        if result is not None:
+            _resolve_pending(*result)
 
 
 async def _async_generate(prefix: str) -> tuple[str, str]:
-    """Run the CPU bound generate_wallet in a thread pool."""
+    """Queue ``prefix`` on the shared search and wait for a matching wallet."""
+    global _search_task
+    prefix = prefix.lower()
+    waiter = asyncio.get_running_loop().create_future()
+    if prefix in pending:
+        # The running round already searches for this prefix.
+        pending[prefix].append(waiter)
+    else:
+        pending[prefix] = [waiter]
+        _pending_changed.set()
+    if _search_task is None or _search_task.done():
+        _search_task = asyncio.create_task(_run_searches())
+    try:
+        return await waiter
+    finally:
+        waiters = pending.get(prefix)
+        if waiters is not None and waiter in waiters:
+            waiters.remove(waiter)
+            if not waiters:
+                del pending[prefix]
+                _pending_changed.set()
+
+
+def mine_wallets(count: int, cipher_key: bytes) -> list[tuple[str, bytes]]:
+    """Generate ``count`` random wallets as (address, encrypted_private_key) rows.
+
+    Unlike generate_wallet, every key is drawn independently: pooled wallets go
+    to different users, and consecutive scalars would let one user recover the
+    keys of the others.
+    """
+    entropy = os.urandom(32 * count)
+    secret_keys = []
+    pubkeys = []
+    for offset in range(0, len(entropy), 32):
+        secret = entropy[offset : offset + 32]
+        try:
+            pubkeys.append(PublicKey.from_secret(secret).format(compressed=False)[1:])
+        except ValueError:
+            # Secret is zero or not below the curve order; astronomically rare.
+            continue
+        secret_keys.append(secret)
+    rows = []
+    for secret, addr in zip(secret_keys, _iter_addresses(pubkeys)):
+        address = "0x" + addr.hex()
+        cipher = AES.new(cipher_key, AES.MODE_GCM)
+        # Bind the ciphertext to its address so rows cannot be swapped.
+        cipher.update(address.encode())
+        ciphertext, tag = cipher.encrypt_and_digest(secret)
+        rows.append((address, cipher.nonce + tag + ciphertext))
+    return rows
+
+
+def _open_pool() -> sqlite3.Connection:
+    """Open the wallet pool database, creating the schema if needed.
+
+    WAL mode lets the miner process write while the bot reads and claims.
+    """
+    db = sqlite3.connect(POOL_PATH, timeout=30)
+    db.execute("PRAGMA journal_mode=WAL")
+    db.execute("PRAGMA synchronous=NORMAL")
+    db.execute(
+        "CREATE TABLE IF NOT EXISTS wallets (address TEXT PRIMARY KEY, privkey_enc BLOB NOT NULL)"
+    )
+    db.commit()
+    return db
+
+
+def _count_pool_rows(db: sqlite3.Connection) -> int:
+    """Return the number of wallets currently in the pool."""
+    (size,) = db.execute("SELECT COUNT(*) FROM wallets").fetchone()
+    return size
+
+
+def store_mined_wallets(count: int, cipher_key: bytes) -> int:
+    """Mine ``count`` wallets and insert them into the pool; runs in the miner process.
+
+    Returns the number of rows actually inserted.
+    """
+    global _miner_db
+    if _miner_db is None:
+        _miner_db = _open_pool()
+    rows = mine_wallets(count, cipher_key)
+    with _miner_db:
+        cursor = _miner_db.executemany("INSERT OR IGNORE INTO wallets VALUES (?, ?)", rows)
+    return cursor.rowcount
+
+
+async def _fill_pool() -> None:
+    """Keep mining random wallets into the pool until it holds POOL_MAX_SIZE rows."""
+    global _pool_size, pool_executor
+    loop = asyncio.get_running_loop()
+    while True:
+        try:
+            if _pool_size >= POOL_MAX_SIZE:
+                await asyncio.sleep(60)
+                continue
+            _pool_size += await loop.run_in_executor(
+                pool_executor, store_mined_wallets, BATCH_SIZE, POOL_CIPHER_KEY
+            )
+        except BrokenProcessPool:
+            # The miner process died; a broken pool never recovers, so replace it.
+            logger.warning("Pool miner died; restarted its process pool")
+            pool_executor.shutdown(wait=False, cancel_futures=True)
+            pool_executor = _new_pool_executor()
+            await asyncio.sleep(5)
+        except Exception as exc:
+            logger.exception("Error filling wallet pool: %s", exc)
+            await asyncio.sleep(60)
+
+
+def _take_pooled_row(start: str) -> Optional[tuple[str, bytes]]:
+    """Delete and return one pool row whose address starts with ``start``.
+
+    Runs on pool_db_executor's thread. Returns (address, privkey_enc) or None.
+    """
+    # Hex digits all sort below "g", so this range covers every address with the prefix.
+    row = _pool_db.execute(
+        "SELECT address, privkey_enc FROM wallets WHERE address >= ? AND address < ? LIMIT 1",
+        (start, start + "g"),
+    ).fetchone()
+    if row is None:
+        return None
+    with _pool_db:
+        cursor = _pool_db.execute("DELETE FROM wallets WHERE address = ?", (row[0],))
+    return row if cursor.rowcount == 1 else None
+
+
+async def _claim_pooled_wallet(prefix: str) -> Optional[tuple[str, str]]:
+    """Take a pooled wallet whose address starts with ``prefix`` out of the pool.
+
+    The row is deleted before the key is returned so no wallet is handed out
+    twice. Returns tuple (address, private_key_hex), or None if there is no hit.
+    """
+    global _pool_size
+    if _pool_db is None:
+        return None
+    loop = asyncio.get_running_loop()
+    row = await loop.run_in_executor(pool_db_executor, _take_pooled_row, "0x" + prefix.lower())
+    if row is None:
+        return None
+    _pool_size -= 1
+    address, blob = row
+    try:
+        cipher = AES.new(POOL_CIPHER_KEY, AES.MODE_GCM, nonce=blob[:16])
+        cipher.update(address.encode())
+        secret = cipher.decrypt_and_verify(blob[32:], blob[16:32])
+        acct = Account.from_key(secret)
+        if acct.address.lower() != address:
+            raise ValueError(f"Pooled key does not belong to {address}")
+    except ValueError as exc:
+        logger.exception("Discarding unreadable pooled wallet %s: %s", address, exc)
+        return None
+    return address, acct.key.hex()
+
+
+async def _log_search_rate() -> None:
+    """Log the search throughput every TELEMETRY_INTERVAL seconds while it changes."""
     loop = asyncio.get_running_loop()
-    return await loop.run_in_executor(executor, generate_wallet, prefix)
+    last_attempts = attempts_counter.value
+    last_time = loop.time()
+    while True:
+        await asyncio.sleep(TELEMETRY_INTERVAL)
+        attempts = attempts_counter.value
+        now = loop.time()
+        if attempts != last_attempts:
+            logger.info(
+                "Search rate: %.0f keys/s over %d workers (%d keys total)",
+                (attempts - last_attempts) / (now - last_time),
+                WORKERS,
+                attempts,
+            )
+        last_attempts, last_time = attempts, now
+
+
+async def _post_init(application) -> None:
+    """Start the search telemetry, and the background pool miner when POOL_KEY is configured."""
+    global _pool_db, _pool_size, _pool_task, _telemetry_task
+    _telemetry_task = asyncio.create_task(_log_search_rate())
+    if not POOL_KEY:
+        return
+    loop = asyncio.get_running_loop()
+    _pool_db = await loop.run_in_executor(pool_db_executor, _open_pool)
+    _pool_size = await loop.run_in_executor(pool_db_executor, _count_pool_rows, _pool_db)
+    _pool_task = asyncio.create_task(_fill_pool())
+    logger.info("Wallet pool enabled at %s", POOL_PATH)
 
 
 async def generate_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -79,7 +642,7 @@ async def generate_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -
     prefix = context.args[0]
 
     # Validate prefix
-    if not HEX_PATTERN.fullmatch(prefix):
+    if not prefix or not HEX_DIGITS.issuperset(prefix):
         await update.message.reply_text("Prefiks harus berupa karakter heksadesimal (0-9, a-f).")
         return
 
@@ -87,16 +650,20 @@ async def generate_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -
         await update.message.reply_text("Prefiks terlalu panjang (maks 6 karakter disarankan).")
         return
 
-    await update.message.reply_text(
-        f"⏳ Sedang mencari alamat yang dimulai dengan 0x{prefix} ... Mohon tunggu."
-    )
+    wallet = await _claim_pooled_wallet(prefix)
+    if wallet is None:
+        await update.message.reply_text(
+            f"⏳ Sedang mencari alamat yang dimulai dengan 0x{prefix} ... Mohon tunggu."
+        )
 
-    try:
-        address, priv_key = await _async_generate(prefix)
-    except Exception as exc:
-        logger.exception("Error generating wallet: %s", exc)
-        await update.message.reply_text("Terjadi kesalahan saat membuat dompet. Coba lagi nanti.")
-        return
+        try:
+            wallet = await _async_generate(prefix)
+        except Exception as exc:
+            logger.exception("Error generating wallet: %s", exc)
+            await update.message.reply_text("Terjadi kesalahan saat membuat dompet. Coba lagi nanti.")
+            return
+
+    address, priv_key = wallet
 
     # Send result (beware of privacy)
     await update.message.reply_text(
@@ -116,7 +683,7 @@ async def unknown_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
 def main() -> None:
     """Run the Telegram bot."""
 
-    application = ApplicationBuilder().token(BOT_TOKEN).build()
+    application = ApplicationBuilder().token(BOT_TOKEN).post_init(_post_init).build()
 
     application.add_handler(CommandHandler("start", start))
     application.add_handler(CommandHandler("generate", generate_handler))